@@ -3,82 +3,398 @@ Content Analyzer Module
 Analyzes web content for fake news detection using NLP techniques
 """
 
+import os
 import re
+import functools
+import importlib.util
+import xml.etree.ElementTree as ET
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
-from textblob import TextBlob
-import nltk
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urlsplit, urlunsplit
+from threading import Lock
+from cachetools import LRUCache, TTLCache
+from rate_limit import TokenBucket
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 import logging
+import math
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+# Sentence boundary: whitespace following terminal punctuation
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+# Lowercase word tokens for lexicon lookups, split like TextBlob's tokenizer
+# (apostrophes separate tokens, "isn't" -> "is", "n", "t"); '!' is kept as
+# its own token because it boosts the preceding sentiment word
+WORD_RE = re.compile(r"[\w-]+?(?=n't\b)|[\w-]+|!")
 
+# Words that negate the next sentiment word ("not good")
+NEGATIONS = frozenset(('no', 'not', "n't", 'never'))
 
-class ContentAnalyzer:
-    """Analyzes content for fake news indicators"""
+# Number of leading body characters tokenized for the word-level checks
+ANALYSIS_HEAD_CHARS = 2000
+
+# Leading 'www.' label, dropped when deriving a page's domain
+WWW_PREFIX_RE = re.compile(r'^www\.')
+
+# Standalone number in a headline (listicle marker)
+NUMBER_RE = re.compile(r'\b\d+\b')
+
+# Phrases typical of clickbait headlines, matched against the lowercased title
+CLICKBAIT_PHRASES = (
+    'you won\'t believe', 'shocking', 'this one trick',
+    'doctors hate', 'what happened next', 'the truth about',
+    'they don\'t want you to know', 'mind-blowing'
+)
+CLICKBAIT_RE = re.compile('|'.join(re.escape(phrase) for phrase in CLICKBAIT_PHRASES))
+
+# Upper bound on bytes read from a single response body
+MAX_CONTENT_BYTES = 2_000_000
+
+# <meta charset> / http-equiv declaration, sniffed from the start of a body
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([\w.:-]+)', re.I)
+
+# Bytes searched for a <meta charset> declaration
+CHARSET_SNIFF_BYTES = 4096
+
+# Content types that are parsed as HTML
+HTML_CONTENT_TYPES = ('text/', 'application/xhtml+xml')
+
+# Optional HuggingFace model for batch sentiment (e.g.
+# 'distilbert-base-uncased-finetuned-sst-2-english'); empty uses the lexicon
+SENTIMENT_MODEL = os.environ.get('SENTIMENT_MODEL', '')
+
+# Per-host politeness: sustained requests per second and burst size
+FETCH_HOST_RATE = float(os.environ.get('FETCH_HOST_RATE', 1.0))
+FETCH_HOST_BURST = float(os.environ.get('FETCH_HOST_BURST', 2))
+
+# Longest pause honoured from a host's Retry-After header, in seconds
+MAX_HOST_BACKOFF = 10
+
+# Longest a fetch queues for its host's token before giving up, in seconds
+FETCH_HOST_MAX_WAIT = float(os.environ.get('FETCH_HOST_MAX_WAIT', 5))
+
+# Headers sent with every outgoing fetch
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+# Directory holding the bundled source lists
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def _load_domain_list(filename):
+    """Load a domain list from DATA_DIR, skipping blank lines and comments"""
+    with open(os.path.join(DATA_DIR, filename), encoding='utf-8') as f:
+        lines = (line.strip().lower() for line in f)
+        return frozenset(line for line in lines if line and not line.startswith('#'))
+
+
+def _match_domain(domain, sources):
+    """
+    Return the most specific entry of sources matching domain, or ''
     
-    # Known credible news sources (simplified list)
-    CREDIBLE_SOURCES = {
-        'reuters.com', 'apnews.com', 'bbc.com', 'bbc.co.uk',
-        'npr.org', 'pbs.org', 'theguardian.com', 'nytimes.com',
-        'washingtonpost.com', 'wsj.com', 'economist.com'
-    }
+    'news.infowars.com' is checked as 'news.infowars.com' and then
+    'infowars.com'; the bare TLD is never looked up.
+    """
+    labels = domain.lower().partition(':')[0].split('.')
+    for i in range(len(labels) - 1):
+        suffix = '.'.join(labels[i:])
+        if suffix in sources:
+            return suffix
+    return ''
+
+
+@functools.lru_cache(maxsize=None)
+def _sentiment_lexicon():
+    """
+    Load TextBlob's pattern sentiment lexicon
+    
+    Returns {word: (polarity, subjectivity, intensity, is_modifier)}.
+    Scores are averaged per part of speech and then across parts of
+    speech, the same reduction TextBlob applies for untagged words;
+    is_modifier marks words with an adverb sense ("very", "really").
+    Like TextBlob, every adjective also yields an adverb entry with the
+    same scores ("terrible" -> "terribly").
+    Loaded on first use so importing the app stays cheap. Only the data
+    file is read; the textblob package itself (and NLTK behind it) is
+    never imported.
+    """
+    package_dir = importlib.util.find_spec('textblob').submodule_search_locations[0]
+    path = os.path.join(package_dir, 'en', 'en-sentiment.xml')
+    senses = {}
+    for node in ET.parse(path).getroot().iter('word'):
+        scores = (
+            float(node.get('polarity', 0.0)),
+            float(node.get('subjectivity', 0.0)),
+            float(node.get('intensity', 1.0))
+        )
+        senses.setdefault(node.get('form').lower(), {}).setdefault(node.get('pos'), []).append(scores)
     
-    # Known questionable sources
-    QUESTIONABLE_SOURCES = {
-        'infowars.com', 'naturalnews.com', 'beforeitsnews.com'
+    def mean(rows):
+        return tuple(sum(column) / len(rows) for column in zip(*rows))
+    
+    lexicon = {
+        word: mean([mean(scores) for scores in by_pos.values()]) + ('RB' in by_pos,)
+        for word, by_pos in senses.items()
     }
+    for word, by_pos in senses.items():
+        if 'JJ' in by_pos:
+            stem = word[:-1] + 'i' if word.endswith('y') else word
+            stem = stem[:-2] if stem.endswith('le') else stem
+            lexicon[stem + 'ly'] = mean(by_pos['JJ']) + (True,)
+    return lexicon
+
+
+@functools.lru_cache(maxsize=None)
+def _sentiment_pipeline():
+    """
+    Load the SENTIMENT_MODEL transformers pipeline, once per process
+    
+    Returns None when no model is configured, transformers is not
+    installed or the model cannot be loaded, in which case callers fall
+    back to the lexicon scorer.
+    """
+    if not SENTIMENT_MODEL:
+        return None
+    
+    try:
+        import torch
+        from transformers import pipeline
+    except ImportError:
+        logger.warning("SENTIMENT_MODEL is set but transformers is not installed; using lexicon sentiment")
+        return None
+    
+    try:
+        return pipeline(
+            'sentiment-analysis',
+            model=SENTIMENT_MODEL,
+            device=0 if torch.cuda.is_available() else -1
+        )
+    except Exception as e:
+        logger.error(f"Error loading sentiment model: {e}")
+        return None
+
+
+def _retry_after_seconds(value, default=1.0):
+    """
+    Parse a Retry-After header value into seconds
+    
+    Accepts delta-seconds or an HTTP-date; anything unparseable falls
+    back to default. The result is clamped to 0..MAX_HOST_BACKOFF.
+    """
+    try:
+        seconds = float(value)
+        if not math.isfinite(seconds):
+            seconds = default
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            seconds = default
+    return min(max(seconds, 0.0), MAX_HOST_BACKOFF)
+
+
+def _decode_html(body, response):
+    """
+    Decode an HTML body to str
+    
+    Uses the charset from the Content-Type header, then a <meta charset>
+    near the start of the body, then UTF-8; undecodable bytes are replaced.
+    """
+    encodings = []
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        encodings.append(response.encoding)
+    match = META_CHARSET_RE.search(body[:CHARSET_SNIFF_BYTES])
+    if match:
+        encodings.append(match.group(1).decode('ascii'))
+    encodings.append('utf-8')
+    
+    for encoding in encodings:
+        try:
+            return body.decode(encoding, errors='replace')
+        except (LookupError, TypeError):
+            continue
+
+
+def _caps_count(buf):
+    """
+    Count ASCII uppercase letters in a uint8 byte buffer
+    
+    Subtracting 65 wraps everything below 'A' around to large values,
+    so a single comparison catches exactly 'A'..'Z'.
+    """
+    return int(np.count_nonzero((buf - np.uint8(65)) < 26))
+
+
+def parse_url(url):
+    """
+    Parse URL once into a cache key and the domain used for scoring
+    
+    The cache key lowercases scheme and host and drops the fragment,
+    which never changes the fetched document. The domain is the
+    lowercased host without a leading 'www.'.
+    
+    Returns:
+        tuple: (cache_key, domain)
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    cache_key = urlunsplit((parts.scheme.lower(), host, parts.path, parts.query, ''))
+    return cache_key, WWW_PREFIX_RE.sub('', host, count=1)
+
+
+class ContentAnalyzer:
+    """Analyzes content for fake news indicators"""
+    
+    # Known credible and questionable sources, see data/*.txt
+    CREDIBLE_SOURCES = _load_domain_list('credible_sources.txt')
+    QUESTIONABLE_SOURCES = _load_domain_list('questionable_sources.txt')
     
     def __init__(self):
-        self.stopwords = set(nltk.corpus.stopwords.words('english'))
+        # Persistent session so repeated fetches reuse keep-alive connections.
+        # Retry-After is not honoured here: a remote site must not be able
+        # to park a fetch for as long as it likes
+        self.session = requests.Session()
+        self.session.headers.update(REQUEST_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, respect_retry_after_header=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Parsed pages keyed by URL, shared by all endpoints
+        self.content_cache = TTLCache(maxsize=256, ttl=3600)
+        self._content_cache_lock = Lock()
+        
+        # Token bucket per site so a batch cannot hammer a single host;
+        # idle buckets are full again, so evicting them is harmless
+        self._host_buckets = LRUCache(maxsize=1024)
+        self._host_buckets_lock = Lock()
+    
+    def _host_bucket(self, host):
+        """Return the token bucket for host"""
+        with self._host_buckets_lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(FETCH_HOST_RATE, FETCH_HOST_BURST)
+                self._host_buckets[host] = bucket
+        return bucket
     
-    def fetch_content(self, url):
+    def fetch_content(self, url, domain=None):
         """
         Fetch and extract text content from URL
         
         Args:
             url (str): URL to fetch content from
+            domain (str): Domain from parse_url, parsed from url if None
             
         Returns:
             dict: Contains 'title', 'text', 'domain', 'success', 'error'
         """
+        with self._content_cache_lock:
+            cached = self.content_cache.get(url)
+        if cached is not None:
+            return cached
+        
+        if domain is None:
+            _, domain = parse_url(url)
+        
+        bucket = self._host_bucket(domain)
+        if not bucket.acquire(max_wait=FETCH_HOST_MAX_WAIT):
+            return {
+                'success': False,
+                'error': f"Rate limited: too many pending requests to {domain}, try again later"
+            }
+        
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            with self.session.get(url, timeout=10, stream=True) as response:
+                # Slow down further requests to a host that says it is overloaded
+                if response.status_code == 429:
+                    bucket.backoff(_retry_after_seconds(response.headers.get('Retry-After', '')))
+                
+                response.raise_for_status()
+                
+                # Refuse non-HTML bodies before downloading them
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                    return {
+                        'success': False,
+                        'error': f"Unsupported content type: {content_type}"
+                    }
+                
+                html = _decode_html(self._read_capped(response), response)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching URL: {e}")
+            return {
+                'success': False,
+                'error': f"Failed to fetch content: {str(e)}"
             }
+        
+        content_data = self._parse_content(html, url, domain)
+        
+        # Only successful fetches are cached so transient errors can be retried
+        if content_data['success']:
+            with self._content_cache_lock:
+                self.content_cache[url] = content_data
+        
+        return content_data
+    
+    def _read_capped(self, response):
+        """
+        Read a streamed response body, stopping after MAX_CONTENT_BYTES
+        
+        Args:
+            response (requests.Response): Response opened with stream=True
             
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+        Returns:
+            bytes: Decoded body, truncated to MAX_CONTENT_BYTES
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_CONTENT_BYTES:
+                break
+        return b''.join(chunks)[:MAX_CONTENT_BYTES]
+    
+    def _parse_content(self, html, url, domain):
+        """
+        Extract title and body text from HTML
+        
+        Args:
+            html (str): Decoded response body
+            url (str): URL the body was fetched from
+            domain (str): Domain of url, see parse_url
             
-            soup = BeautifulSoup(response.content, 'lxml')
+        Returns:
+            dict: Same shape as fetch_content
+        """
+        try:
+            tree = LexborHTMLParser(html)
             
             # Extract title
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "No title found"
+            title = tree.css_first('title')
+            title_text = title.text().strip() if title else "No title found"
             
             # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
+            for node in tree.css('script, style, nav, footer, header'):
+                node.decompose()
             
             # Extract text from paragraphs
-            paragraphs = soup.find_all(['p', 'article'])
-            text_content = ' '.join([p.get_text().strip() for p in paragraphs])
-            
-            # Get domain
-            domain = urlparse(url).netloc.replace('www.', '')
+            paragraphs = tree.css('p, article')
+            text_content = ' '.join([p.text().strip() for p in paragraphs])
             
             return {
                 'success': True,
@@ -88,12 +404,6 @@ class ContentAnalyzer:
                 'url': url
             }
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching URL: {e}")
-            return {
-                'success': False,
-                'error': f"Failed to fetch content: {str(e)}"
-            }
         except Exception as e:
             logger.error(f"Error parsing content: {e}")
             return {
@@ -101,23 +411,124 @@ class ContentAnalyzer:
                 'error': f"Failed to parse content: {str(e)}"
             }
     
-    def analyze_sentiment(self, text):
+    def analyze_sentiment(self, text_lower):
         """
         Analyze sentiment of text
         
+        Averages the lexicon scores of the known words in the text with
+        the pattern rules TextBlob applies: an adverb scales the next word
+        by its intensity ("very bad"), '!' boosts the previous word by 25%,
+        and a negation, which may be separated by short words ("not a good
+        idea"), multiplies the polarity by -0.5 ("not good" is slightly bad).
+        
+        Args:
+            text_lower (str): Lowercased text, typically the article head
+            
         Returns:
             dict: polarity (-1 to 1) and subjectivity (0 to 1)
         """
-        blob = TextBlob(text)
+        lexicon = _sentiment_lexicon()
+        # Each assessment is [polarity, subjectivity, intensity, negated]
+        assessments = []
+        modifier = None
+        negation = None
+        for w in WORD_RE.findall(text_lower):
+            if w in lexicon:
+                p, s, i, is_modifier = lexicon[w]
+                if modifier is None:
+                    assessments.append([p, s, i, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(p * last[2], 1.0))
+                    last[1] = max(-1.0, min(s * last[2], 1.0))
+                    last[2] = i
+                if negation is not None:
+                    assessments[-1][2] = 1.0 / assessments[-1][2]
+                    assessments[-1][3] = True
+                modifier = w if is_modifier else None
+                negation = w if w in NEGATIONS else None
+            else:
+                if w in NEGATIONS:
+                    negation = w
+                elif negation and len(w.strip("'")) > 1:
+                    negation = None
+                # "really not good": the negation attaches to the modifier
+                if negation is not None and modifier is not None and modifier.endswith('ly'):
+                    assessments[-1][3] = True
+                    negation = None
+                elif modifier and len(w) > 2:
+                    modifier = None
+                if w == '!' and assessments:
+                    assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+        
+        if not assessments:
+            return {
+                'polarity': 0.0,
+                'subjectivity': 0.0
+            }
+        
+        scores = [(p * -0.5 if negated else p, s) for p, s, _, negated in assessments]
+        polarity, subjectivity = np.mean(scores, axis=0)
         return {
-            'polarity': blob.sentiment.polarity,
-            'subjectivity': blob.sentiment.subjectivity
+            'polarity': float(polarity),
+            'subjectivity': float(subjectivity)
         }
     
-    def detect_clickbait(self, title, text):
+    def analyze_sentiment_batch(self, texts):
+        """
+        Analyze sentiment of several texts in one pass
+        
+        Uses the SENTIMENT_MODEL pipeline when available, batching all
+        texts through the model at once; polarity is the model's signed
+        confidence and subjectivity still comes from the lexicon.
+        Otherwise each text is scored with analyze_sentiment.
+        
+        Model inference is CPU/GPU-bound and runs inline: under gevent
+        workers it blocks every other request in the same worker until
+        the batch is scored, so size WEB_CONCURRENCY accordingly.
+        
+        Args:
+            texts (list): Texts to score, typically article heads
+            
+        Returns:
+            list: polarity/subjectivity dicts, one per text
+        """
+        lexicon_results = [self.analyze_sentiment(text.lower()) for text in texts]
+        
+        # Blank pages stay neutral and are kept out of the model batch
+        scored = [i for i, text in enumerate(texts) if text.strip()]
+        
+        sentiment_model = _sentiment_pipeline() if scored else None
+        if sentiment_model is None:
+            return lexicon_results
+        
+        predictions = sentiment_model([texts[i] for i in scored], batch_size=16, truncation=True)
+        
+        results = list(lexicon_results)
+        for i, prediction in zip(scored, predictions):
+            label = prediction['label'].lower()
+            # Map confidence 0.5..1 onto polarity 0..1, signed by label
+            strength = max(2 * prediction['score'] - 1, 0.0)
+            if label.startswith('neg'):
+                polarity = -strength
+            elif label.startswith('pos'):
+                polarity = strength
+            else:
+                polarity = 0.0
+            results[i] = {
+                'polarity': float(polarity),
+                'subjectivity': lexicon_results[i]['subjectivity']
+            }
+        return results
+    
+    def detect_clickbait(self, title, title_lower):
         """
         Detect clickbait indicators
         
+        Args:
+            title (str): Page title
+            title_lower (str): Lowercased page title
+            
         Returns:
             dict: clickbait score and indicators
         """
@@ -137,18 +548,12 @@ class ContentAnalyzer:
             indicators.append("Excessive capitalization")
         
         # Check for clickbait phrases
-        clickbait_phrases = [
-            'you won\'t believe', 'shocking', 'this one trick',
-            'doctors hate', 'what happened next', 'the truth about',
-            'they don\'t want you to know', 'mind-blowing'
-        ]
-        
-        title_lower = title.lower()
-        for phrase in clickbait_phrases:
-            if phrase in title_lower:
-                score += 25
-                indicators.append(f"Clickbait phrase: '{phrase}'")
-                break
+        matched = set(CLICKBAIT_RE.findall(title_lower))
+        if matched:
+            # Report the first phrase in list order, not the leftmost match
+            phrase = next(p for p in CLICKBAIT_PHRASES if p in matched)
+            score += 25
+            indicators.append(f"Clickbait phrase: '{phrase}'")
         
         # Check for question in title
         if '?' in title:
@@ -156,7 +561,7 @@ class ContentAnalyzer:
             indicators.append("Question-based headline")
         
         # Check for numbers in title (listicles)
-        if re.search(r'\b\d+\b', title):
+        if NUMBER_RE.search(title):
             score += 10
             indicators.append("Number-based headline (listicle)")
         
@@ -169,16 +574,23 @@ class ContentAnalyzer:
         """
         Analyze source credibility based on domain
         
+        When domain matches both lists, the longer (more specific) entry
+        wins, so a questionable site hosted under a credible parent is
+        still flagged; an identical entry in both lists counts as credible.
+        
         Returns:
             dict: credibility score and classification
         """
-        if domain in self.CREDIBLE_SOURCES:
+        credible = _match_domain(domain, self.CREDIBLE_SOURCES)
+        questionable = _match_domain(domain, self.QUESTIONABLE_SOURCES)
+        
+        if credible and len(credible) >= len(questionable):
             return {
                 'score': 90,
                 'classification': 'Highly Credible',
                 'note': 'Well-established news organization'
             }
-        elif domain in self.QUESTIONABLE_SOURCES:
+        elif questionable:
             return {
                 'score': 20,
                 'classification': 'Questionable',
@@ -192,10 +604,15 @@ class ContentAnalyzer:
                 'note': 'Source credibility cannot be verified'
             }
     
-    def analyze_text_quality(self, text):
+    def analyze_text_quality(self, text, words_lower, text_bytes):
         """
         Analyze text quality and linguistic patterns
         
+        Args:
+            text (str): Full body text
+            words_lower (list): Lowercased words from the start of the text
+            text_bytes (numpy.ndarray): UTF-8 bytes of text as uint8
+            
         Returns:
             dict: quality metrics
         """
@@ -209,19 +626,13 @@ class ContentAnalyzer:
         score = 100
         
         # Check for excessive capitalization
-        caps_ratio = sum(1 for c in text if c.isupper()) / len(text)
+        caps_ratio = _caps_count(text_bytes) / text_bytes.size
         if caps_ratio > 0.1:
             score -= 20
             issues.append("Excessive capitalization")
         
-        # Check for spelling errors (simplified)
-        words = text.split()
-        if len(words) > 50:
-            blob = TextBlob(text[:500])  # Check first 500 chars
-            # This is a simplified check
-            
         # Check for very short sentences (might indicate poor quality)
-        sentences = nltk.sent_tokenize(text[:1000])
+        sentences = SENTENCE_SPLIT_RE.split(text[:1000])
         if sentences:
             avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
             if avg_sentence_length < 5:
@@ -229,9 +640,8 @@ class ContentAnalyzer:
                 issues.append("Unusually short sentences")
         
         # Check for repetitive content
-        words_lower = [w.lower() for w in words[:200]]
-        unique_ratio = len(set(words_lower)) / len(words_lower) if words_lower else 0
-        if unique_ratio < 0.3:
+        head_words = words_lower[:200]
+        if not head_words or len(set(head_words)) < 0.3 * len(head_words):
             score -= 20
             issues.append("Highly repetitive content")
         
@@ -307,19 +717,62 @@ class ContentAnalyzer:
                 'color': '#ef4444'
             }
     
-    def analyze(self, url):
+    def analyze(self, url, domain=None):
         """
         Perform complete analysis on URL
         
         Args:
             url (str): URL to analyze
+            domain (str): Domain from parse_url, parsed from url if None
             
         Returns:
             dict: Complete analysis results
         """
-        # Fetch content
-        content_data = self.fetch_content(url)
+        # Same scoring path as batches, so a cached result does not depend
+        # on which endpoint produced it
+        return self.analyze_parsed_batch([self.fetch_content(url, domain=domain)])[0]
+    
+    def analyze_parsed_batch(self, contents):
+        """
+        Perform complete analysis on several already fetched pages
+        
+        Sentiment for all pages that need it is scored in a single
+        analyze_sentiment_batch call, so a configured model is invoked
+        once per batch rather than once per page.
+        
+        Args:
+            contents (list): Results of fetch_content
+            
+        Returns:
+            list: Complete analysis results, one per page
+        """
+        # Known questionable sources take the fast path and skip sentiment
+        needs_sentiment = [
+            content for content in contents
+            if content['success']
+            and self.analyze_source_credibility(content['domain'])['classification'] != 'Questionable'
+        ]
+        sentiments = self.analyze_sentiment_batch(
+            [content['text'][:ANALYSIS_HEAD_CHARS] for content in needs_sentiment]
+        )
+        sentiment_by_page = {id(content): s for content, s in zip(needs_sentiment, sentiments)}
+        
+        return [
+            self._analyze_parsed(content, sentiment=sentiment_by_page.get(id(content)))
+            for content in contents
+        ]
+    
+    def _analyze_parsed(self, content_data, sentiment=None):
+        """
+        Perform complete analysis on already fetched content
         
+        Args:
+            content_data (dict): Result of fetch_content
+            sentiment (dict): Precomputed sentiment, scored here if None
+            
+        Returns:
+            dict: Complete analysis results
+        """
         if not content_data['success']:
             return {
                 'success': False,
@@ -330,22 +783,68 @@ class ContentAnalyzer:
         text = content_data['text']
         domain = content_data['domain']
         
-        # Perform analyses
-        sentiment = self.analyze_sentiment(text)
-        clickbait = self.detect_clickbait(title, text)
+        title_lower = title.lower()
         source_credibility = self.analyze_source_credibility(domain)
-        text_quality = self.analyze_text_quality(text)
+        clickbait = self.detect_clickbait(title, title_lower)
+        
+        # Fast path for known-bad domains: skip the body text passes and
+        # flag the page outright. Skipped checks carry no scores
+        if source_credibility['classification'] == 'Questionable':
+            analysis_data = {
+                'sentiment': {
+                    'polarity': None,
+                    'subjectivity': None,
+                    'skipped': True
+                },
+                'clickbait': clickbait,
+                'source_credibility': source_credibility,
+                'text_quality': {
+                    'score': None,
+                    'issues': ['Not analyzed (known questionable source)'],
+                    'skipped': True
+                }
+            }
+            return self._build_result(content_data, analysis_data, source_credibility['score'])
+        
+        # Tokenize once and share across the remaining checks; the body is
+        # also encoded once into a byte array for the character-level stats
+        text_head_lower = text[:ANALYSIS_HEAD_CHARS].lower()
+        words_lower = text_head_lower.split()
+        text_bytes = np.frombuffer(text.encode('utf-8', 'ignore'), dtype=np.uint8)
+        
+        # Perform analyses
+        if sentiment is None:
+            sentiment = self.analyze_sentiment(text_head_lower)
         
-        # Compile analysis data
         analysis_data = {
             'sentiment': sentiment,
             'clickbait': clickbait,
             'source_credibility': source_credibility,
-            'text_quality': text_quality
+            'text_quality': self.analyze_text_quality(text, words_lower, text_bytes)
         }
         
         # Calculate overall credibility
         credibility_score = self.calculate_credibility_score(analysis_data)
+        
+        return self._build_result(content_data, analysis_data, credibility_score)
+    
+    def _build_result(self, content_data, analysis_data, credibility_score):
+        """
+        Assemble the analysis response with warning level and key findings
+        
+        Args:
+            content_data (dict): Result of fetch_content
+            analysis_data (dict): Individual analysis results
+            credibility_score (int): Overall credibility score (0-100)
+            
+        Returns:
+            dict: Complete analysis results
+        """
+        sentiment = analysis_data['sentiment']
+        clickbait = analysis_data['clickbait']
+        source_credibility = analysis_data['source_credibility']
+        text_quality = analysis_data['text_quality']
+        
         warning = self.get_warning_level(credibility_score)
         
         # Generate key findings
@@ -359,10 +858,11 @@ class ContentAnalyzer:
         elif source_credibility['classification'] == 'Questionable':
             key_findings.append("Source has history of publishing misleading content")
         
-        if sentiment['subjectivity'] > 0.6:
+        if not sentiment.get('skipped') and sentiment['subjectivity'] > 0.6:
             key_findings.append("Content is highly subjective/opinion-based")
         
-        if text_quality['issues'] and text_quality['issues'][0] != 'No major issues detected':
+        if (not text_quality.get('skipped') and text_quality['issues']
+                and text_quality['issues'][0] != 'No major issues detected'):
             key_findings.append(f"Text quality issues: {text_quality['issues'][0]}")
         
         if not key_findings:
@@ -370,9 +870,9 @@ class ContentAnalyzer:
         
         return {
             'success': True,
-            'url': url,
-            'title': title,
-            'domain': domain,
+            'url': content_data['url'],
+            'title': content_data['title'],
+            'domain': content_data['domain'],
             'credibility_score': credibility_score,
             'warning': warning,
             'analysis': {
@@ -3,9 +3,19 @@ Deepfake AI Tracker - Flask Backend
 Main application file for fake news detection API
 """
 
+# Patch the standard library before anything imports sockets or threads,
+# so requests and the batch thread pool become cooperative under gevent
+from gevent import monkey
+monkey.patch_all()
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from cachetools import TTLCache
+import orjson
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from analyzer import ContentAnalyzer
+from analyzer import ContentAnalyzer, parse_url
 import logging
 import os
 
@@ -13,8 +23,30 @@ import os
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.get_json"""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a decode
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.option),
+            mimetype='application/json'
+        )
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configure CORS - Allow requests from frontend
 allowed_origins = [
@@ -40,6 +72,81 @@ CORS(app, resources={
 # Initialize analyzer
 analyzer = ContentAnalyzer()
 
+# Maximum number of URLs fetched concurrently per batch request
+BATCH_FETCH_CONCURRENCY = 10
+
+# Shared pool for batch fetches, reused across requests
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_FETCH_CONCURRENCY)
+
+# Completed analyses keyed by normalized URL
+analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+analysis_cache_lock = Lock()
+
+
+def get_cached_analysis(cache_key):
+    """Return a recent successful analysis for cache_key, or None"""
+    with analysis_cache_lock:
+        return analysis_cache.get(cache_key)
+
+
+def cache_analysis(cache_key, result):
+    """Remember a successful analysis; failures are never cached"""
+    if result['success']:
+        with analysis_cache_lock:
+            analysis_cache[cache_key] = result
+
+
+def invalid_url_result(error):
+    """Failed analysis result for a URL that cannot be parsed"""
+    return {
+        'success': False,
+        'error': f"Invalid URL: {str(error)}"
+    }
+
+
+def cached_analyze(url):
+    """Analyze URL, reusing a recent successful result for the same page"""
+    try:
+        cache_key, domain = parse_url(url)
+    except ValueError as e:
+        return invalid_url_result(e)
+    
+    result = get_cached_analysis(cache_key)
+    if result is None:
+        result = analyzer.analyze(url, domain=domain)
+        cache_analysis(cache_key, result)
+    return result
+
+
+def cached_analyze_batch(urls):
+    """
+    Analyze several URLs, reusing cached results where possible
+    
+    Uncached pages are fetched in parallel on batch_executor, then scored
+    together so batch sentiment runs once for the whole request.
+    """
+    parsed = [None] * len(urls)
+    results = [None] * len(urls)
+    for i, url in enumerate(urls):
+        # An unparseable URL fails on its own, not the whole batch
+        try:
+            parsed[i] = parse_url(url)
+        except ValueError as e:
+            results[i] = invalid_url_result(e)
+            continue
+        results[i] = get_cached_analysis(parsed[i][0])
+    misses = [i for i, result in enumerate(results) if result is None]
+    
+    contents = list(batch_executor.map(
+        lambda i: analyzer.fetch_content(urls[i], domain=parsed[i][1]),
+        misses
+    ))
+    for i, result in zip(misses, analyzer.analyze_parsed_batch(contents)):
+        cache_analysis(parsed[i][0], result)
+        results[i] = result
+    
+    return results
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -91,7 +198,7 @@ def analyze_url():
         logger.info(f"Analyzing URL: {url}")
         
         # Perform analysis
-        result = analyzer.analyze(url)
+        result = cached_analyze(url)
         
         if not result['success']:
             return jsonify(result), 400
@@ -141,10 +248,7 @@ def batch_analyze():
                 'error': 'Maximum 10 URLs allowed per batch'
             }), 400
         
-        results = []
-        for url in urls:
-            result = analyzer.analyze(url.strip())
-            results.append(result)
+        results = cached_analyze_batch([url.strip() for url in urls])
         
         return jsonify({
             'success': True,
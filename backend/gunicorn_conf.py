@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for the Deepfake AI Tracker API
+Usage: gunicorn -c gunicorn_conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# gevent workers let many outbound fetches share one process: while a
+# request waits on a remote site, the worker keeps serving others
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 200))
+
+# Batch requests can take several fetch timeouts to complete
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
@@ -0,0 +1,74 @@
+"""
+Rate Limiting Module
+Token buckets used to keep outgoing fetches polite towards each host
+"""
+
+import time
+from threading import Lock
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second"""
+    
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate (float): Tokens added per second; 0 disables limiting
+            capacity (float): Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self, max_wait=None):
+        """
+        Take one token, sleeping until it is available
+        
+        The token is reserved under the lock and the wait happens outside
+        it, so concurrent callers queue up in order without blocking each
+        other on the lock.
+        
+        Args:
+            max_wait (float): Longest sleep accepted, in seconds; None waits
+                as long as needed
+            
+        Returns:
+            bool: True once the token is taken, False if it would take
+                longer than max_wait (no token is reserved then)
+        """
+        if self.rate <= 0:
+            return True
+        
+        with self._lock:
+            self._refill()
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0
+            if max_wait is not None and wait > max_wait:
+                return False
+            self._tokens -= 1
+        
+        if wait:
+            time.sleep(wait)
+        return True
+    
+    def backoff(self, seconds):
+        """
+        Make the next acquisition wait at least `seconds`
+        
+        Used when the host answers 429 Too Many Requests. Repeated calls
+        do not add up: concurrent 429s keep the longest delay, not the sum.
+        """
+        if self.rate <= 0:
+            return
+        
+        with self._lock:
+            self._refill()
+            # With this many tokens the next acquire() goes `seconds` into
+            # debt; a bucket already deeper in debt is left as it is
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
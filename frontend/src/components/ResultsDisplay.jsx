@@ -85,7 +85,9 @@ const ResultsDisplay = ({ results }) => {
                     {/* Text Quality */}
                     <div className="analysis-item">
                         <div className="analysis-item-title">Text Quality</div>
-                        <div className="analysis-item-value">{analysis.text_quality.score}/100</div>
+                        <div className="analysis-item-value">
+                            {analysis.text_quality.skipped ? 'Skipped' : `${analysis.text_quality.score}/100`}
+                        </div>
                         <div className="analysis-item-description">
                             {analysis.text_quality.issues[0]}
                         </div>
@@ -94,14 +96,25 @@ const ResultsDisplay = ({ results }) => {
                     {/* Sentiment Analysis */}
                     <div className="analysis-item">
                         <div className="analysis-item-title">Sentiment Analysis</div>
-                        <div className="analysis-item-value">
-                            {analysis.sentiment.polarity > 0 ? '😊' : analysis.sentiment.polarity < 0 ? '😟' : '😐'}
-                        </div>
-                        <div className="analysis-item-description">
-                            Polarity: {analysis.sentiment.polarity.toFixed(2)}
-                            <br />
-                            Subjectivity: {analysis.sentiment.subjectivity.toFixed(2)}
-                        </div>
+                        {analysis.sentiment.skipped ? (
+                            <>
+                                <div className="analysis-item-value">Skipped</div>
+                                <div className="analysis-item-description">
+                                    Not analyzed (known questionable source)
+                                </div>
+                            </>
+                        ) : (
+                            <>
+                                <div className="analysis-item-value">
+                                    {analysis.sentiment.polarity > 0 ? '😊' : analysis.sentiment.polarity < 0 ? '😟' : '😐'}
+                                </div>
+                                <div className="analysis-item-description">
+                                    Polarity: {analysis.sentiment.polarity.toFixed(2)}
+                                    <br />
+                                    Subjectivity: {analysis.sentiment.subjectivity.toFixed(2)}
+                                </div>
+                            </>
+                        )}
                     </div>
                 </div>
 